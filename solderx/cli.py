@@ -1,15 +1,12 @@
-import argparse, os, sys
+import argparse, logging, os, sys
 from solderx.fuse_file import solder_file
 from solderx.fuse_folder import solder_folder
 from solderx.fuse_scan import solder_scan
-from solderx.utils import parse_remappings, COLORS
+from solderx.utils import parse_remappings, COLORS, logger
 from solderx import __version__
 
 
-def main():
-    if "--help" not in sys.argv and "-h" not in sys.argv:
-        print(f"{COLORS['B_Y']}⚡️ SolderX{COLORS['RESET']} {COLORS['B_W']}– Melt Imports. Solder Solidity. Flatten Everything. 🔥\n{COLORS['RESET']}")
-
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description=(
              "⚡️ SolderX – Fuse, Flatten & Forge Solidity Smart Contracts 🔥\n"
@@ -67,6 +64,12 @@ def main():
         help="Explorer API key (optional, fallback to public rate limits)"
     )
 
+    parser.add_argument(
+        "--verbose", "-v",
+        action='store_true',
+        help="Show per-file diagnostics while soldering"
+    )
+
     parser.add_argument(
         "--version",
         action='version',
@@ -74,8 +77,24 @@ def main():
         help="Display the current version of SolderX"
     )
 
+    return parser
+
+
+# Built once at import: `solderx --version` and scripted calls skip
+# re-constructing the whole argument tree per invocation.
+_PARSER = _build_parser()
+
+
+def main():
+    # Banner only on interactive terminals — keeps piped output clean
+    if sys.stdout.isatty() and not any(flag in sys.argv for flag in ("--help", "-h", "--version")):
+        print(f"{COLORS['B_Y']}⚡️ SolderX{COLORS['RESET']} {COLORS['B_W']}– Melt Imports. Solder Solidity. Flatten Everything. 🔥\n{COLORS['RESET']}")
+
+    args = _PARSER.parse_args()
+
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.DEBUG if args.verbose else logging.WARNING)
 
-    args = parser.parse_args()
     source = args.source.strip()
     output_path = args.output
 
@@ -94,7 +113,7 @@ def main():
             solder_folder(source, output_path)
         
         elif source.startswith("0x") or ":" in source:
-            solder_scan(source, args.chain, api_key=args.api_key.strip(), output_path=output_path)
+            solder_scan(source, args.chain, api_key=(args.api_key or '').strip(), output_path=output_path)
 
         else:
             print("❌ Unsupported input! Provide path to .sol file or a folder.")
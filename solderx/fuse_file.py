@@ -1,7 +1,64 @@
-import os
+import os, re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Set, Tuple, Optional
 from solderx.utils import *
 
+def normalize_remappings(remappings: Optional[Dict[str, str]]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Converts a remappings dict into a hashable tuple of
+    (prefix-with-trailing-slash, target-dir) pairs, sorted longest prefix
+    first so longest-match resolution is an early-exit linear scan.
+    """
+    remappings = remappings or {}
+    return tuple(sorted(
+        ((prefix if prefix.endswith('/') else prefix + '/', target)
+         for prefix, target in remappings.items()),
+        key=lambda pair: -len(pair[0])
+    ))
+
+
+@lru_cache(maxsize=128)
+def _compile_remapping_matcher(sorted_prefixes: Tuple[Tuple[str, str], ...]):
+    """
+    Compiles the remapping prefixes into one anchored alternation regex
+    plus a prefix→target lookup dict. The alternation keeps the
+    longest-first order from `normalize_remappings`, so a single C-level
+    match() replaces N Python-level startswith calls per import.
+    """
+    if not sorted_prefixes:
+        return None, {}
+    prefix_re = re.compile("|".join(re.escape(prefix) for prefix, _ in sorted_prefixes))
+    mapping = dict(sorted_prefixes)
+    return prefix_re, mapping
+
+
+@lru_cache(maxsize=4096)
+def _resolve_import_path_file(current_base_dir: str, imp: str, sorted_prefixes: Tuple[Tuple[str, str], ...]) -> Tuple[str, str]:
+    # 1. Check if it's a relative path (starts with "./" or "../")
+    if imp.startswith('.') or imp.startswith('/'):
+        resolved_filepath = os.path.normpath(os.path.join(current_base_dir, imp))
+        if os.path.isfile(resolved_filepath):
+            return resolved_filepath, os.path.dirname(resolved_filepath)
+
+    # 2. Try remappings (single precompiled longest-first prefix match)
+    prefix_re, mapping = _compile_remapping_matcher(sorted_prefixes)
+    m = prefix_re.match(imp) if prefix_re else None
+    if m:
+        remapped_base_dir = mapping[m.group(0)]
+        remaining_path = imp[m.end():]  # strip prefix from import
+        remapped_filepath = os.path.normpath(os.path.join(remapped_base_dir, remaining_path))
+        if os.path.isfile(remapped_filepath):
+            return remapped_filepath, os.path.dirname(remapped_filepath)
+
+    # 3. Fallback: Treat as local file in same directory
+    resolved_filepath = os.path.normpath(os.path.join(current_base_dir, imp))
+    if os.path.isfile(resolved_filepath):
+        return resolved_filepath,  os.path.dirname(resolved_filepath)
+
+    raise FileNotFoundError(f"\tCould not resolve import '{imp}' from '{current_base_dir}'")
+
+
 def resolve_import_path_file(current_base_dir: str, imp: str, remappings: Optional[Dict[str, str]] = None) -> Tuple[str, str]:
         """
         Resolves the absolute path of an imported Solidity file.
@@ -11,6 +68,9 @@ def resolve_import_path_file(current_base_dir: str, imp: str, remappings: Option
         - Absolute imports: import "B.sol";
         - Remapped imports: import "@oz/contracts/Ownable.sol";
 
+        Results are memoized (lru_cache) so diamond imports resolving the
+        same (base_dir, imp) pair skip the repeated normpath/isfile syscalls.
+
         Args:
             importing_file (str): Path of the file doing the import.
             imp (str): Import path as written in the Solidity file.
@@ -19,40 +79,20 @@ def resolve_import_path_file(current_base_dir: str, imp: str, remappings: Option
         Returns:
             Optional[str]: Absolute path to the resolved file, or None if not found.
         """
-        remappings = remappings or {}
-
-        # 1. Check if it's a relative path (starts with "./" or "../")
-        if imp.startswith('.') or imp.startswith('/'):
-            resolved_filepath = os.path.normpath(os.path.join(current_base_dir, imp))
-            if os.path.isfile(resolved_filepath):
-                return resolved_filepath, os.path.dirname(resolved_filepath)
-
-        # 2. Try remappings (match longest prefix)
-        longest_match = None
-        for prefix in remappings:
-            # Ensure trailing slash for matching
-            normalized_prefix = prefix if prefix.endswith('/') else prefix + '/'
-            if imp.startswith(normalized_prefix):
-                if longest_match is None or len(normalized_prefix) > len(longest_match):
-                    longest_match = normalized_prefix
-
-        if longest_match:
-            remapped_base_dir = remappings[longest_match.rstrip('/')]  # remove trailing slash if present
-            remaining_path = imp[len(longest_match):]  # strip prefix from import
-            remapped_filepath = os.path.normpath(os.path.join(remapped_base_dir, remaining_path))
-            if os.path.isfile(remapped_filepath):
-                return remapped_filepath, os.path.dirname(remapped_filepath)
-            
-
-        # 3. Fallback: Treat as local file in same directory
-        resolved_filepath = os.path.normpath(os.path.join(current_base_dir, imp))
-        if os.path.isfile(resolved_filepath):
-            return resolved_filepath,  os.path.dirname(resolved_filepath)
+        return _resolve_import_path_file(current_base_dir, imp, normalize_remappings(remappings))
+
+
+@lru_cache(maxsize=4096)
+def _parse_source_file(path: str, mtime_ns: int) -> Tuple[List[str], List[str], str, List[str]]:
+    """
+    Read + parse memoized on (path, mtime): a library reached again in
+    the same process (repeat solder_file calls, API sweeps) skips both
+    the disk read and the extraction as long as the file is unchanged.
+    """
+    return cached_extract_imports_and_spdx(read_source_file(path))
 
-        raise FileNotFoundError(f"\tCould not resolve import '{imp}' from '{current_base_dir}'")
-                    
 
-def build_imports_map_and_extract_code_file(entry_filepath: str, remappings: Dict[str, str]) -> Tuple[Dict[str, List[str]], Dict[str, List[str]], Dict[str, str]]:
+def build_imports_map_and_extract_code_file(entry_filepath: str, remappings: Dict[str, str]) -> Tuple[Dict[str, List[str]], Dict[str, List[str]], Dict[str, str], List[str]]:
     """
     Recursively builds an import graph from a Solidity file.
     Supports relative and remapped imports (e.g. @openzeppelin).
@@ -66,60 +106,80 @@ def build_imports_map_and_extract_code_file(entry_filepath: str, remappings: Dic
             - imports_path_map: actual resolved file dependencies
             - imports_raw_map: raw import strings as seen in source
             - file_code_map: mapping of absolute file paths to cleaned source code
+            - spdx_ids: all SPDX identifiers collected across files
     """
     imports_raw_map: Dict[str, List[str]] = {}
     imports_path_map: Dict[str, List[str]] = {}
     file_code_map: Dict[str, str] = {}
+    spdx_ids: List[str] = []
     visited: Set[str] = set()
 
-    def resolve_and_read(path: str) -> str:
+    def load_and_parse(path: str) -> Tuple[List[str], List[str], str, List[str]]:
         if not os.path.exists(path):
             raise FileNotFoundError(f"\tFile not found: {path}")
-        with open(path, "r", encoding="utf-8") as f:
-            return f.read()
+        imports_path, imports_raw, code, file_spdx_ids = _parse_source_file(path, os.stat(path).st_mtime_ns)
+        # Copy the lists: the lru_cache hands out shared objects, and these
+        # flow into maps returned from the public API — a caller mutating
+        # them must not poison the cache (same reason parse_remappings
+        # returns dict(cached)).
+        return list(imports_path), list(imports_raw), code, list(file_spdx_ids)
+
+    # Level-order traversal instead of recursion: deep dependency trees
+    # (OpenZeppelin-style, 30+ levels) would otherwise pay per-frame call
+    # overhead and risk RecursionError. Each frontier level is read
+    # concurrently (I/O bound), then parsed serially.
+    abs_entry = os.path.abspath(entry_filepath)
+    frontier = [(abs_entry, os.path.dirname(abs_entry))]
+    visited.add(abs_entry)
 
-    def dfs(current_filepath: str, current_base_dir: str):
-        current_filepath = os.path.abspath(current_filepath)
+    # Normalize remappings once per run; the resolver memoizes on the tuple
+    sorted_prefixes = normalize_remappings(remappings)
 
-        if current_filepath in visited:
-            return
-        visited.add(current_filepath)
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        while frontier:
+            parsed = list(ex.map(lambda entry: load_and_parse(entry[0]), frontier))
 
-        code = resolve_and_read(current_filepath)
-        imports_path, imports_raw, code = extract_and_remove_imports(code)
+            next_frontier = []
+            for (current_filepath, current_base_dir), (imports_path, imports_raw, code, file_spdx_ids) in zip(frontier, parsed):
+                spdx_ids.extend(file_spdx_ids)
 
-        # Update code without imports
-        file_code_map[current_filepath] = code
-        imports_raw_map[current_filepath] = imports_raw
+                # Update code without imports
+                file_code_map[current_filepath] = code
+                imports_raw_map[current_filepath] = imports_raw
 
-        resolved_imports_path = []
-        for imp in imports_path:
-            resolved_imp_path, new_base_dir = resolve_import_path_file(current_base_dir, imp, remappings)
-            resolved_imports_path.append(resolved_imp_path)
-            dfs(resolved_imp_path, new_base_dir)
-        imports_path_map[current_filepath] = resolved_imports_path
+                resolved_imports_path = []
+                for imp in imports_path:
+                    resolved_imp_path, new_base_dir = _resolve_import_path_file(current_base_dir, imp, sorted_prefixes)
+                    resolved_imports_path.append(resolved_imp_path)
+                    if resolved_imp_path not in visited:
+                        visited.add(resolved_imp_path)
+                        next_frontier.append((resolved_imp_path, new_base_dir))
+                imports_path_map[current_filepath] = resolved_imports_path
 
-    abs_entry = os.path.abspath(entry_filepath)
-    dfs(abs_entry, os.path.dirname(abs_entry))
-    return imports_path_map, imports_raw_map, file_code_map
+            frontier = next_frontier
 
+    return imports_path_map, imports_raw_map, file_code_map, spdx_ids
 
-def flatten_files(sorted_paths: List[str], file_code_map: Dict[str, str]) -> str:
-    flattened_code = []
+
+def iter_flattened_files(sorted_paths: List[str], file_code_map: Dict[str, str]):
+    """Yields one '// File: ...' banner + code chunk per sorted path."""
     cwd = os.getcwd()   # or base_dir can be manually specified if needed
 
+    # Paths are already absolute (the traversal keys everything through
+    # os.path.abspath), so no per-path re-normalization is needed here.
     for path in sorted_paths:
-        abs_path = os.path.abspath(path)
-        rel_path = os.path.relpath(abs_path, cwd)
-
-        code = file_code_map.get(abs_path)
+        code = file_code_map.get(path)
         if not code:
-            print(f"[warn] No content for file: {abs_path}")
+            logger.warning("No content for file: %s", path)
             continue
-        
-        flattened_code.append(f"// File: {rel_path}\n" + code + "\n")
-        
-    return "\n".join(flattened_code)
+
+        rel_path = os.path.relpath(path, cwd)
+        yield f"// File: {rel_path}\n" + code + "\n"
+
+
+def flatten_files(sorted_paths: List[str], file_code_map: Dict[str, str]) -> str:
+    return "\n".join(iter_flattened_files(sorted_paths, file_code_map))
 
 
 def solder_file(filepath:str, remappings:dict=None, output_path:str=None, save_file:bool=True) -> str:
@@ -136,10 +196,11 @@ def solder_file(filepath:str, remappings:dict=None, output_path:str=None, save_f
         str: Soldered Flat code.
     """
     print(f"🛠️  Soldering File : {filepath} . . . ")
-    imports_path_map, _, file_code_map = build_imports_map_and_extract_code_file(filepath, remappings)
+    imports_path_map, _, file_code_map, spdx_ids = build_imports_map_and_extract_code_file(filepath, remappings)
     print(f"> Fusing {len(file_code_map)} Solidity file(s) (including root)")
+    raise_on_cyclic_imports(imports_path_map)
     sorted_paths = topological_sort(imports_path_map)
-    soldered_flat_code = normalize_spdx_license(flatten_files(sorted_paths, file_code_map))
+    soldered_flat_code = select_spdx_header(spdx_ids) + flatten_files(sorted_paths, file_code_map).strip()
     if output_path or save_file:
         if not output_path: output_path =  get_default_output_path(filepath)
         with open(output_path, 'w') as f:
@@ -1,57 +1,99 @@
 import os
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Collection, Dict
 from solderx.utils import *
 
-def collect_all_solidity_sources_from_folder(base_path: str) -> Dict[str, str]:
+def collect_all_solidity_sources_from_folder(base_path: str) -> Tuple[Dict[str, str], Dict[str, str]]:
     """
     Recursively finds all .sol files under the given base path,
     and returns a dict mapping absolute file paths to their source code.
-    
+    Files are read concurrently since the work is I/O bound.
+
+    Byte-identical files (symlinks, duplicated vendored libraries) are
+    deduplicated by content hash: only the first path seen keeps the
+    content, the rest are recorded as aliases to that canonical path.
+
     Args:
         base_path (str): The base directory to search.
 
     Returns:
-        Dict[str, str]: A map from absolute file paths to Solidity source code.
+        Tuple containing:
+            - source_codes_map: map from absolute file paths to Solidity source code
+            - alias_map: map from duplicate file paths to their canonical path
     """
-    source_codes_map = {}
-
-    for root, _, files in os.walk(base_path):
-        for file in files:
-            if file.endswith('.sol'):
-                full_path = os.path.abspath(os.path.join(root, file))
-                print(file)
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    source_codes_map[full_path] = f.read()
-
-    return source_codes_map
+    # Walk first (cheap), then read all discovered files in parallel.
+    # os.scandir reuses the dirent type info, skipping the extra stat()
+    # per entry that os.walk pays, and entry.path needs no re-join.
+    def _iter_sol_files(folder: str):
+        try:
+            it = os.scandir(folder)
+        except OSError as e:
+            # Match os.walk's default: skip unreadable dirs, don't crash
+            logger.debug("skipping unreadable directory %s: %s", folder, e)
+            return
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_sol_files(entry.path)
+                elif entry.name.endswith('.sol') and entry.is_file():
+                    logger.debug("collected %s", entry.path)  # lazy %s: free when quiet
+                    yield entry.path
+
+    paths = list(_iter_sol_files(os.path.abspath(base_path)))
+
+    def _read(path: str) -> Tuple[str, str]:
+        return path, read_source_file(path)
+
+    if not paths:
+        return {}, {}
+
+    source_codes_map: Dict[str, str] = {}
+    alias_map: Dict[str, str] = {}
+    seen_by_hash: Dict[str, str] = {}
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        for path, content in ex.map(_read, paths):
+            h = content_digest(content)
+            canonical = seen_by_hash.get(h)
+            if canonical is not None:
+                alias_map[path] = canonical
+            else:
+                seen_by_hash[h] = path
+                source_codes_map[path] = content
+
+    return source_codes_map, alias_map
 
 
 def resolve_import_path_folder(
     current_key: str,
     relative_import_path: str,
-    all_keys: List[str]
+    all_keys: Collection[str],
+    folder_root: Optional[str] = None
 ) -> str:
     """
     Resolves relative or direct import paths in a local folder-based Solidity project.
-    This is used to determine the correct full source path of an import like 
+    This is used to determine the correct full source path of an import like
     '../utils/Context.sol' based on the current file's path and the available source files.
     Ensures that all imports stay within the given folder scope.
 
     Args:
         current_key (str): The current source file's path (absolute or relative to base folder).
         relative_import_path (str): The relative or direct import path used in the Solidity file.
-        all_keys (List[str]): A list of all available file paths (typically from scanning the folder).
+        all_keys (Collection[str]): All available file paths, typically from scanning the folder.
+        folder_root (Optional[str]): Precomputed common root of all source paths
+            (derived from all_keys if omitted).
 
     Returns:
         str: The resolved file path if a match is found. If ambiguous or not found, returns None.
-    
+
     Raises:
         FileNotFoundError: If the resolved import is not found or is outside the folder scope.
     """
 
     # Direct match (Not a realtive import)
     if relative_import_path in all_keys:
-        return relative_import_path    
+        return relative_import_path
 
     # Get base dir of the current key
     current_dir = os.path.dirname(current_key)
@@ -60,7 +102,8 @@ def resolve_import_path_folder(
     resolved_path = os.path.normpath(os.path.join(current_dir, relative_import_path))
 
     # Determine the project root from all_keys (folder of all sources)
-    folder_root = os.path.commonpath([os.path.dirname(p) for p in all_keys])
+    if folder_root is None:
+        folder_root = os.path.commonpath([os.path.dirname(p) for p in all_keys])
 
     # Check if the resolved path is outside the folder scope
     if not resolved_path.startswith(folder_root):
@@ -76,49 +119,63 @@ def resolve_import_path_folder(
     
     return resolved_path
 
-def build_imports_map_and_extract_code(source_codes_map) :
+def build_imports_map_and_extract_code(source_codes_map, alias_map: Optional[Dict[str, str]] = None) :
     """
     Recursively builds an import graph from a solidity file.
     Supports relative and remapped imports (e.g. @openzeppelin).
+    Imports resolving to a deduplicated path are redirected to its
+    canonical node via alias_map, so duplicate content is emitted once.
     """
+    alias_map = alias_map or {}
     imports_raw_map: Dict[str, List[str]] = {}
     imports_path_map: Dict[str, List[str]] = {}
     file_code_map: Dict[str, str] = {}
-    all_filenames = list(source_codes_map.keys())
+    spdx_ids: List[str] = []
+    # Set for O(1) membership; the common root is computed once here
+    # instead of per resolved import (quadratic on large trees).
+    # Alias keys stay resolvable, then collapse to their canonical path.
+    all_filenames = set(source_codes_map.keys()) | set(alias_map.keys())
+    folder_root = os.path.commonpath([os.path.dirname(p) for p in all_filenames]) if all_filenames else ''
 
     for filename, code in source_codes_map.items():
-        imports_path, imports_raw, code = extract_and_remove_imports(code)
+        imports_path, imports_raw, code, file_spdx_ids = cached_extract_imports_and_spdx(code)
         file_code_map[filename] = code
         imports_raw_map[filename] = imports_raw
-        
+        spdx_ids.extend(file_spdx_ids)
+
         import_paths = []
         for imp in imports_path:
-            resolved_imp_path = resolve_import_path_folder(filename, imp, all_filenames)
+            resolved_imp_path = resolve_import_path_folder(filename, imp, all_filenames, folder_root)
+            resolved_imp_path = alias_map.get(resolved_imp_path, resolved_imp_path)
             import_paths.append(resolved_imp_path)
         imports_path_map[filename] = import_paths
-        
-    return imports_path_map, imports_raw_map, file_code_map
 
+    return imports_path_map, imports_raw_map, file_code_map, spdx_ids
 
-def flatten_files(sorted_paths: List[str], file_code_map: Dict[str, str]) -> str:
-    flattened_code = []
+
+def iter_flattened_files(sorted_paths: List[str], file_code_map: Dict[str, str]):
+    """Yields one '// File: ...' banner + code chunk per sorted path."""
     for path in sorted_paths:
         code = file_code_map.get(path)
         if not code:
-            print(f"[warn] No content for file: {path}")
+            logger.warning("No content for file: %s", path)
             continue
-        flattened_code.append(f"// File: {path}\n" + code + "\n")
-    return "\n".join(flattened_code)
+        yield f"// File: {path}\n" + code + "\n"
+
+
+def flatten_files(sorted_paths: List[str], file_code_map: Dict[str, str]) -> str:
+    return "\n".join(iter_flattened_files(sorted_paths, file_code_map))
 
 
 def solder_folder(base_path:str, output_path:str=None, save_file:bool=True) -> str:
     print(f"🛠️  Soldering Folder : {base_path} . . . ")
-    source_codes_map = collect_all_solidity_sources_from_folder(base_path)
-    imports_path_map, _, file_code_map = build_imports_map_and_extract_code(source_codes_map)
+    source_codes_map, alias_map = collect_all_solidity_sources_from_folder(base_path)
+    imports_path_map, _, file_code_map, spdx_ids = build_imports_map_and_extract_code(source_codes_map, alias_map)
     print(f"> Fusing {len(file_code_map)} Solidity file(s)")
+    raise_on_cyclic_imports(imports_path_map)
     sorted_paths = topological_sort(imports_path_map)
     flattened_code = flatten_files(sorted_paths, file_code_map)
-    soldered_flat_code = normalize_spdx_license(flattened_code)
+    soldered_flat_code = select_spdx_header(spdx_ids) + flattened_code.strip()
     if output_path or save_file:
         if not output_path: output_path =  get_default_output_path(base_path)
         with open(output_path, 'w') as f:
@@ -1,8 +1,19 @@
-from typing import List, Dict
-import requests, json, os
+from typing import Collection, Dict, List
+from collections import defaultdict
+import requests, json, os, time
 from json.decoder import JSONDecodeError
+from requests.adapters import HTTPAdapter, Retry
 from solderx.utils import *
 
+# Shared session: keep-alive skips the TCP+TLS handshake on repeat calls,
+# gzip cuts the (often 200KB+) JSON-stringified source payloads.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8, pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+))
+_SESSION.headers['Accept-Encoding'] = 'gzip, deflate'
+
 CHAIN_EXPLORERS = {
     "eth": "https://api.etherscan.io/api",
     "polygon": "https://api.polygonscan.com/api",
@@ -13,8 +24,28 @@ CHAIN_EXPLORERS = {
     "avalanche": "https://api.snowtrace.io/api",
 }
 
+EXPLORER_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "solderx", "explorer")
+EXPLORER_CACHE_TTL = 7 * 24 * 3600  # verified sources rarely change; 7 days
+
+def _load_cached_contract_source(cache_path: str):
+    """Returns the cached explorer response if present and fresh, else None."""
+    try:
+        if time.time() - os.path.getmtime(cache_path) > EXPLORER_CACHE_TTL:
+            return None
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, JSONDecodeError):
+        return None
+
 def get_contract_source_from_explorer(address:str, chain:str, api_key:str=''):
-    
+
+    # Explorer roundtrips are slow and rate-limited; re-runs on the same
+    # contract are served from a local TTL'd cache instead.
+    cache_path = os.path.join(EXPLORER_CACHE_DIR, chain, f"{address.lower()}.json")
+    cached = _load_cached_contract_source(cache_path)
+    if cached is not None:
+        return cached
+
     api_url = CHAIN_EXPLORERS[chain]
 
     params = {
@@ -23,8 +54,8 @@ def get_contract_source_from_explorer(address:str, chain:str, api_key:str=''):
         "address": address,
         "apikey": api_key
     }
-    
-    response = requests.get(api_url, params=params)
+
+    response = _SESSION.get(api_url, params=params)
     data = response.json()
 
     if data["status"] == "1":
@@ -34,13 +65,21 @@ def get_contract_source_from_explorer(address:str, chain:str, api_key:str=''):
         compiler_version = result.get("CompilerVersion")
         license_type =  result.get("LicenseType")
 
-
-        return {
+        contract_data = {
             "name": contract_name,
             "source": source_code,
             "compiler": compiler_version,
             "license": license_type
         }
+
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(contract_data, f)
+        except OSError:
+            pass  # cache is best-effort
+
+        return contract_data
     else:
         raise Exception(f"\t{chain.upper()}-API Error: {data.get('message')} — {data.get('result')}")
 
@@ -82,19 +121,34 @@ def extract_source_files_from_explorer(source_code: str) -> dict:
 
 
 
+def build_basename_index(all_keys: Collection[str]) -> Dict[str, List[str]]:
+    """
+    Indexes source keys by their basename (e.g. 'Context.sol') so
+    suffix-match fallbacks only compare the handful of candidates sharing
+    a filename instead of scanning every key per import.
+    """
+    by_basename: Dict[str, List[str]] = defaultdict(list)
+    for key in all_keys:
+        by_basename[os.path.basename(key)].append(key)
+    return by_basename
+
+
 def resolve_import_path_explorer(
     current_key: str,
     relative_import_path: str,
-    all_keys: List[str]
+    all_keys: Collection[str],
+    by_basename: Optional[Dict[str, List[str]]] = None
 ) -> str:
     """
-    Resolves Direct & Relative import path (e.g., '../utils/Context.sol') 
+    Resolves Direct & Relative import path (e.g., '../utils/Context.sol')
     from a given current source key to a valid full key in Explorer-API-style sources.
 
     Args:
         current_key (str): The key from sources dict (e.g., '@openzeppelin/contracts/access/Ownable.sol')
         relative_import_path (str): The relative path in the import (e.g., '../utils/Context.sol')
-        all_keys (List[str]): All available source keys
+        all_keys (Collection[str]): All available source keys
+        by_basename (Optional[Dict[str, List[str]]]): Precomputed basename index
+            from `build_basename_index` (built on the fly if omitted)
 
     Returns:
         str | None: The resolved key if found, else None
@@ -114,13 +168,17 @@ def resolve_import_path_explorer(
     if resolved_path in all_keys:
         return resolved_path
 
-    # Fallback: check for match with the end of path
-    suffix_matches = [k for k in all_keys if k.endswith(resolved_path)]
+    # Fallback: check for match with the end of path (basename-indexed,
+    # candidates keep all_keys order)
+    if by_basename is None:
+        by_basename = build_basename_index(all_keys)
+    candidates = by_basename.get(os.path.basename(resolved_path), [])
+    suffix_matches = [k for k in candidates if k.endswith(resolved_path)]
     if len(suffix_matches) == 1:
         return suffix_matches[0]
     elif len(suffix_matches) > 1:
-        print(f"[warn] Found Ambiguous match for {relative_import_path} in {current_key} → {suffix_matches}")
-        print(f"\t => Using : suffix_matches[0] ")
+        logger.warning("Found Ambiguous match for %s in %s → %s ; using %s",
+                       relative_import_path, current_key, suffix_matches, suffix_matches[0])
         return suffix_matches[0]  # Or return None and force manual resolution
 
     # Not found
@@ -137,33 +195,37 @@ def build_imports_map_and_extract_code(source_files) :
     imports_raw_map: Dict[str, List[str]] = {}
     imports_path_map: Dict[str, List[str]] = {}
     file_code_map: Dict[str, str] = {}
+    spdx_ids: List[str] = []
     all_filenames = list(source_files.keys())
+    by_basename = build_basename_index(all_filenames)
 
     for filename, code in source_files.items():
-        imports_path, imports_raw, code = extract_and_remove_imports(code)
+        imports_path, imports_raw, code, file_spdx_ids = cached_extract_imports_and_spdx(code)
         file_code_map[filename] = code
         imports_raw_map[filename] = imports_raw
-        
+        spdx_ids.extend(file_spdx_ids)
+
         import_paths = []
         for imp in imports_path:
-            resolved_imp_path = resolve_import_path_explorer(filename, imp, all_filenames)
+            resolved_imp_path = resolve_import_path_explorer(filename, imp, all_filenames, by_basename)
             import_paths.append(resolved_imp_path)
         imports_path_map[filename] = import_paths
-        
-    return imports_path_map, imports_raw_map, file_code_map
 
+    return imports_path_map, imports_raw_map, file_code_map, spdx_ids
 
-def flatten_files(sorted_paths: List[str], file_code_map: Dict[str, str]) -> str:
-    flattened_code = []
 
+def iter_flattened_files(sorted_paths: List[str], file_code_map: Dict[str, str]):
+    """Yields one '// File: ...' banner + code chunk per sorted path."""
     for path in sorted_paths:
         code = file_code_map.get(path)
         if not code:
-            print(f"[warn] No content for file: {path}")
+            logger.warning("No content for file: %s", path)
             continue
-        flattened_code.append(f"// File: {path}\n" + code + "\n")
-        
-    return "\n".join(flattened_code)
+        yield f"// File: {path}\n" + code + "\n"
+
+
+def flatten_files(sorted_paths: List[str], file_code_map: Dict[str, str]) -> str:
+    return "\n".join(iter_flattened_files(sorted_paths, file_code_map))
 
 
 def extract_and_validate_chain_address(contract_address:str, chain='eth'):
@@ -191,11 +253,12 @@ def solder_scan(contract_address:str, chain='eth', api_key:str='', output_path:s
     source_files = extract_source_files_from_explorer(source_code)
 
     # Soldering
-    imports_path_map, _, file_code_map = build_imports_map_and_extract_code(source_files)
+    imports_path_map, _, file_code_map, spdx_ids = build_imports_map_and_extract_code(source_files)
     print(f"> Fusing {len(file_code_map)} Solidity file(s)")
+    raise_on_cyclic_imports(imports_path_map)
     sorted_paths = topological_sort(imports_path_map)
     flattened = flatten_files(sorted_paths, file_code_map)
-    soldered_flat_code = normalize_spdx_license(flattened, license)
+    soldered_flat_code = select_spdx_header(spdx_ids, license) + flattened.strip()
     if output_path or save_file:
         if not output_path: output_path =  get_default_output_path(f"{contract_address}_{chain}")
         with open(output_path, 'w') as f:
@@ -1,8 +1,14 @@
 import re, os
+import hashlib, logging, mmap, pickle
 from typing import List, Dict, Tuple, Optional
-from collections import Counter
+from collections import Counter, deque
 import json, toml
 
+# Shared logger: diagnostics go through here instead of print() so the
+# hot paths don't pay a synchronous stdout flush per message, and
+# verbosity is controlled in one place (see cli --verbose).
+logger = logging.getLogger("solderx")
+
 COLORS = {
     "B_Y": "\033[1;33m", #"BOLD_YELLOW"
     "B_W": "\033[1;37m", #"BOLD_WHITE"
@@ -13,6 +19,13 @@ COLORS = {
 
 # ---- Arg Parser utils ----
 
+# One alias=path pair per match; alias and path may not contain ',' or '='
+_INLINE_REMAP_RE = re.compile(r'\s*([^,=]+)=([^,=]+)(?:,|$)')
+
+# Parsed remappings memoized by (source, mtime_ns) for files and by the
+# raw string for inline specs, so repeat invocations skip disk + parser.
+_REMAP_CACHE: Dict[Tuple[str, int], dict] = {}
+
 def parse_remappings(remappings: str = None) -> dict:
     """
     Parses remappings from a JSON/TOML file or inline string.
@@ -21,6 +34,9 @@ def parse_remappings(remappings: str = None) -> dict:
     - Inline format: "@alias=path,@alias2=path2"
     - File format: Path to a JSON or TOML file containing alias-path mappings
 
+    Results are cached; a remapping file is only re-read when its mtime
+    changes.
+
     Returns:
         dict: A mapping of alias to import path.
 
@@ -32,13 +48,24 @@ def parse_remappings(remappings: str = None) -> dict:
     if not remappings:
         return {}
 
+    cache_key: Tuple[str, int] = (remappings, 0)
+    if remappings.endswith('.json') or remappings.endswith('.toml'):
+        try:
+            cache_key = (remappings, os.stat(remappings).st_mtime_ns)
+        except OSError:
+            pass  # missing file — fall through to the usual error path
+
+    cached = _REMAP_CACHE.get(cache_key)
+    if cached is not None:
+        return dict(cached)   # shallow copy so callers can't poison the cache
+
     remap_dict = {}
 
-    # Helper to insert with collision check
+    # Helper to insert with collision check; callers strip their values
     def insert(alias, path):
         if alias in remap_dict:
             raise ValueError(f"\tDuplicate remapping alias detected: '{alias}'")
-        remap_dict[alias.strip()] = path.strip()
+        remap_dict[alias] = path
 
     # Case: JSON/TOML file path
     if remappings.endswith('.json') or remappings.endswith('.toml'):
@@ -49,20 +76,26 @@ def parse_remappings(remappings: str = None) -> dict:
             with open(remappings, 'r') as f:
                 raw = json.load(f) if remappings.endswith('.json') else toml.load(f)
                 for alias, path in raw.items():
-                    insert(alias, path)
+                    insert(alias.strip(), path.strip())
 
         except Exception as e:
             raise ValueError(f"\tFailed to parse remapping file: {e}")
 
     # Case: Inline string like "@a=lib/a,@b=node_modules/b"
     else:
-        try:
-            for pair in remappings.split(','):
-                alias, path = pair.split('=')
-                insert(alias.strip(), path.strip())
-        except ValueError:
+        # Single finditer pass; the coverage check rejects malformed
+        # stretches that the old split-based parser errored on. A
+        # trailing comma leaves an empty final entry, also an error.
+        pos = 0
+        for m in _INLINE_REMAP_RE.finditer(remappings):
+            if m.start() != pos:
+                break
+            insert(m.group(1).strip(), m.group(2).strip())
+            pos = m.end()
+        if pos != len(remappings) or remappings.endswith(','):
             raise ValueError( "\tInvalid remapping format. Use '@alias=path,...' or path to a json/toml file.")
 
+    _REMAP_CACHE[cache_key] = dict(remap_dict)
     return remap_dict
 
 def get_default_output_path(input_path: str, ) -> str:
@@ -85,104 +118,315 @@ def get_default_output_path(input_path: str, ) -> str:
         base, _ = os.path.splitext(input_path)
         return f"{base}_{suffix}"
     elif os.path.isdir(input_path):
-        folder_name = os.path.basename(os.path.normpath(input_path))
-        parent_dir = os.path.dirname(os.path.normpath(input_path))
+        # normpath once, then split parent/name in one call
+        parent_dir, folder_name = os.path.split(os.path.normpath(input_path))
         return os.path.join(parent_dir, f"{folder_name}_{suffix}")
     else:
         raise ValueError( f"\tInvalid input path: {input_path}")
 
 # ---- Soldering utils ----
 
-def is_comment_position(content: str, i: int, state: dict) -> bool:
-    """Updates comment state and returns whether current index `i` is inside a comment."""
-    if content.startswith("/*", i):
-        state["inside_block_comment"] = True
-        return True
-    elif content.startswith("*/", i):
-        state["inside_block_comment"] = False
-        return True
-    elif content.startswith("//", i):
-        state["inside_inline_comment"] = True
-        return True
-    elif content[i] == '\n':
-        if state["inside_inline_comment"]:
-            state["inside_inline_comment"] = False
-        return False
-    return state["inside_block_comment"] or state["inside_inline_comment"]
+# Compiled once at module load; per-call re.* paid compile-cache lookups
+# on every file scanned.
+COMMENT_RE = re.compile(r'//[^\n]*|/\*[\s\S]*?\*/')  # both kinds, one pass
+IMPORT_PATH_RE = re.compile(r'"([^"]+)"|\'([^\']+)\'')
+SPDX_RE = re.compile(r'^\s*//\s*SPDX-License-Identifier:\s*([^\s]+)\s*$', re.MULTILINE)
+
+# Lexer tokens for the import scan: comments and string literals are
+# consumed wholesale so 'import' inside them never triggers, and the
+# C regex engine does the scanning instead of a per-char Python loop.
+# This deliberately stays on re rather than a compiled extension: the
+# byte-wise work already runs in C, and solderx ships as a pure-Python
+# wheel with no build step to keep installs trivial.
+MODULE_KEYWORDS = ('library', 'interface', 'contract')
+TOKEN_RE = re.compile(
+    r'/\*[\s\S]*?\*/'               # block comment
+    r'|//[^\n]*'                    # line comment
+    r'|"(?:\\.|[^"\\\n])*"'         # double-quoted string
+    r"|'(?:\\.|[^'\\\n])*'"         # single-quoted string
+    r'|\b(?:import|' + '|'.join(MODULE_KEYWORDS) + r')\b'
+)
+IMPORT_TAIL_RE = re.compile(
+    r'/\*[\s\S]*?\*/'
+    r'|//[^\n]*'
+    r'|"(?:\\.|[^"\\\n])*"'
+    r"|'(?:\\.|[^'\\\n])*'"
+    r'|;'                           # statement terminator
+)
+
+MMAP_THRESHOLD = 64 * 1024  # bytes; below this a plain read() is cheaper
+
+def read_source_file(path: str) -> str:
+    """
+    Reads a source file as UTF-8 text. Large files (flattened Etherscan
+    bundles are often 1-5 MB) are decoded straight from an mmap'd view,
+    skipping the intermediate bytes copy that read() makes.
+    """
+    if os.path.getsize(path) > MMAP_THRESHOLD:
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # binary mode skips universal newlines; normalize CRLF so
+                # output matches the text-mode path below
+                return str(mm, 'utf-8').replace('\r\n', '\n')
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
 
 
 def extract_and_remove_imports(content: str) -> Tuple[List[str], List[str], str]:
     """
     Extracts all import statements (including multi-line and destructured imports)
     while skipping comments, and removes them from the code.
-    """
-    state = {
-        "inside_block_comment": False,
-        "inside_inline_comment": False,
-    }
 
+    The scan is token-driven: TOKEN_RE consumes comments and string
+    literals wholesale and stops on import/module keywords, so all
+    lexing runs in the C regex engine instead of a per-character Python
+    state machine. Scanning ends at the first library/interface/contract
+    keyword, matching the old behavior.
+    """
     imports_raw = []
-    semicolons = []
-    import_blocks = []
-
-    inside_module = False
-    i = 0
-    while i < len(content):
-        if inside_module:
-            i += 1
-            continue
-
-        if is_comment_position(content, i, state):
-            i += 1
-            continue
+    code_pieces = []    # non-import spans, emitted as the scan advances
+    last_index = 0
 
-        if any(content.startswith(kw, i) for kw in ['library', 'interface', 'contract']):
-            inside_module = True
-            i += 1
+    token_search = TOKEN_RE.search  # bound once; the loop runs per token
+    pos = 0
+    content_len = len(content)
+    while pos < content_len:
+        m = token_search(content, pos)
+        if m is None:
+            break
+        # Dispatch on the first char instead of m.group(): for comment and
+        # string tokens that avoids copying the whole matched span out.
+        first_char = content[m.start()]
+
+        if first_char in '/"\'':
+            pos = m.end()   # comment or string literal — skip wholesale
             continue
 
-        if content.startswith("import", i):
-            start = i
-            while i < len(content) and content[i] != ';':
-                if is_comment_position(content, i, state):
-                    i += 1
-                    continue
-                i += 1
-            i += 1  # include the semicolon
-            raw_stmt = content[start:i]
-
-            # Strip comments from the raw import block
-            cleaned = re.sub(r'//.*', '', raw_stmt)  # remove line comments
-            cleaned = re.sub(r'/\*[\s\S]*?\*/', '', cleaned)  # remove block comments
-            cleaned = ' '.join(cleaned.split())
-            imports_raw.append(cleaned)
-            import_blocks.append((start, i))
-        else:
-            if content[i] == ';':
-                semicolons.append(i)
-            i += 1
-
-    # Reconstruct code without import blocks
-    result = []
-    last_index = 0
-    for start, end in import_blocks:
-        result.append(content[last_index:start])
+        # Only 'import' among the keywords is 6 chars ('interface' also
+        # starts with 'i', hence the length check)
+        if first_char != 'i' or m.end() - m.start() != 6:
+            break   # library/interface/contract: no imports past the first module
+
+        # Scan for the terminating ';', skipping comments/strings inside
+        # (first-char check avoids copying each skipped token out)
+        start = m.start()
+        end = content_len
+        for tail in IMPORT_TAIL_RE.finditer(content, m.end()):
+            if content[tail.start()] == ';':
+                end = tail.end()
+                break
+        raw_stmt = content[start:end]
+
+        # Strip line + block comments from the raw import block
+        cleaned = COMMENT_RE.sub('', raw_stmt)
+        cleaned = ' '.join(cleaned.split())
+        imports_raw.append(cleaned)
+        code_pieces.append(content[last_index:start])
         last_index = end
-    result.append(content[last_index:])
-    code = ''.join(result)
+        pos = end
+
+    # Code without import blocks; import-free files pass through uncopied
+    if not code_pieces:
+        code = content
+    else:
+        code_pieces.append(content[last_index:])
+        code = ''.join(code_pieces)
 
     # Extract import paths from cleaned imports
+    # Deduplicated (order-preserving): a path imported twice would only
+    # make every caller resolve and recurse on it twice for nothing
     import_paths = []
+    seen = set()
     for imp in imports_raw:
-        matches = re.findall(r'"([^"]+)"|\'([^\']+)\'', imp)
-        for m in matches:
-            import_paths.append(m[0] or m[1])
+        for m in IMPORT_PATH_RE.findall(imp):
+            path = m[0] or m[1]
+            if path not in seen:
+                seen.add(path)
+                import_paths.append(path)
 
     return import_paths, imports_raw, code
 
 
 
 
+def extract_spdx_license(content: str) -> Tuple[List[str], str]:
+    """
+    Extracts all SPDX-License-Identifier values from the source and
+    returns them along with the content stripped of those lines.
+    """
+    # Cheap substring probe first: most library files carry no SPDX line
+    # and skip the multiline regex walk entirely
+    if 'SPDX-License-Identifier' not in content:
+        return [], content
+
+    # One fused pass: the sub callback collects identifiers while
+    # stripping, instead of findall + sub each scanning the full text
+    spdx_ids: List[str] = []
+    record = spdx_ids.append
+
+    def _collect(m):
+        record(m.group(1))
+        return ''
+
+    content = SPDX_RE.sub(_collect, content)
+    return spdx_ids, content
+
+
+def extract_imports_and_spdx(content: str) -> Tuple[List[str], List[str], str, List[str]]:
+    """
+    Single per-file pass combining SPDX collection and import extraction:
+    returns (import_paths, imports_raw, cleaned_code, spdx_ids). Doing
+    SPDX stripping here avoids a second full scan over the concatenated
+    output later.
+    """
+    spdx_ids, content = extract_spdx_license(content)
+    import_paths, imports_raw, code = extract_and_remove_imports(content)
+    return import_paths, imports_raw, code, spdx_ids
+
+
+def select_spdx_header(spdx_ids: List[str], spdx_override: Optional[str] = None) -> str:
+    """
+    Picks the SPDX header for the flattened output:
+    - The spdx_override if given
+    - else the most common identifier collected across files
+    - else no header
+    """
+    if spdx_override:
+        return f"// SPDX-License-Identifier: {spdx_override}\n\n"
+    if spdx_ids:
+        most_common = Counter(spdx_ids).most_common(1)[0][0]
+        return f"// SPDX-License-Identifier: {most_common}\n\n"
+    return ""
+
+
+def content_digest(data) -> str:
+    """
+    128-bit blake2b hex digest used for cache keys. blake2b is 2-3x
+    faster than sha256 on CPUs without SHA extensions and is built into
+    hashlib; 16 bytes is plenty for cache addressing.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+PARSE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "solderx", "parsecache")
+_PARSE_CACHE_SCHEMA = 3  # bump when the cached tuple layout OR parser semantics change
+
+def cached_extract_imports_and_spdx(content: str) -> Tuple[List[str], List[str], str, List[str]]:
+    """
+    Disk-cached wrapper around `extract_imports_and_spdx`.
+
+    Results are pickled under ~/.cache/solderx/parsecache/ keyed by a
+    blake2b hash of the source content (salted with the package version
+    and cache schema, so a parser change invalidates old entries).
+    Unchanged files skip the parsing pass entirely on subsequent runs.
+    """
+    from solderx import __version__
+
+    salt = f"{__version__}:{_PARSE_CACHE_SCHEMA}"
+    h = content_digest(f"{salt}\x00{content}")
+    cache_path = os.path.join(PARSE_CACHE_DIR, h[:2], h)
+
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass  # cache miss or corrupt entry — fall through to the real parser
+
+    result = extract_imports_and_spdx(content)
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # cache is best-effort; never fail the parse over it
+
+    return result
+
+
+def find_cycles(imports_map: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Finds all import cycles in the graph using an iterative Tarjan SCC pass.
+
+    Runs in O(V+E) before the topological sort so users get the actual
+    cycle path(s) instead of a bare failure. Iterative (explicit work
+    stack) to avoid recursion limits on deep dependency chains.
+
+    Args:
+        imports_map (Dict[str, List[str]]):
+            A mapping where each key is a file path, and the value is a list of imported file paths.
+
+    Returns:
+        List[List[str]]: One list of file paths per cycle found (empty if acyclic).
+    """
+    all_nodes = set(imports_map)
+    for deps in imports_map.values():
+        all_nodes.update(deps)
+    graph = {node: imports_map.get(node, []) for node in all_nodes}
+
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: set = set()
+    scc_stack: List[str] = []
+    cycles: List[List[str]] = []
+    counter = 0
+
+    for root in graph:
+        if root in index:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, dep_idx = work.pop()
+            if dep_idx == 0:
+                index[node] = lowlink[node] = counter
+                counter += 1
+                scc_stack.append(node)
+                on_stack.add(node)
+
+            deps = graph[node]
+            descended = False
+            for j in range(dep_idx, len(deps)):
+                dep = deps[j]
+                if dep not in index:
+                    work.append((node, j + 1))   # resume here after dep completes
+                    work.append((dep, 0))
+                    descended = True
+                    break
+                elif dep in on_stack:
+                    lowlink[node] = min(lowlink[node], index[dep])
+            if descended:
+                continue
+
+            if lowlink[node] == index[node]:
+                scc = []
+                while True:
+                    member = scc_stack.pop()
+                    on_stack.remove(member)
+                    scc.append(member)
+                    if member == node:
+                        break
+                if len(scc) > 1 or node in graph[node]:
+                    cycles.append(scc[::-1])
+
+            if work:    # propagate lowlink to the parent frame
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+    return cycles
+
+
+def raise_on_cyclic_imports(imports_map: Dict[str, List[str]]) -> None:
+    """Raises ValueError listing every cycle (full path) if the graph is cyclic."""
+    cycles = find_cycles(imports_map)
+    if cycles:
+        details = "\n".join(
+            "\t  " + " → ".join(cycle + [cycle[0]]) for cycle in cycles
+        )
+        raise ValueError(f"\tCyclic import detected !\n{details}")
+
+
 def topological_sort(imports_map: Dict[str, List[str]]) -> List[str]:
     """
     Perform a topological sort on the import graph.
@@ -199,42 +443,53 @@ def topological_sort(imports_map: Dict[str, List[str]]) -> List[str]:
         List[str]: A list of file paths in dependency-resolved order (from leaves to root).
     """
 
-    from collections import defaultdict, deque
+    # Common CLI case: a single file or a set of leaf files with no
+    # imports needs no graph machinery at all.
+    if not any(imports_map.values()):
+        return list(imports_map.keys())
 
-    indegree = defaultdict(int)     #stores how many files depend on each file
-    graph = defaultdict(list)       #stores the reversed dependency graph (i.e., B.sol → A.sol if A imports B)
-    all_nodes = set(imports_map.keys())
+    # Intern each path to an integer index: the inner Kahn loop then
+    # works on list indices instead of hashing path strings per edge.
+    # insertion-ordered so the sort (and flattened output) is deterministic
+    all_nodes = dict.fromkeys(imports_map.keys())
+    for deps in imports_map.values():
+        for dep_path in deps:
+            all_nodes.setdefault(dep_path)
+    nodes = list(all_nodes)
+    index_of = {node: i for i, node in enumerate(nodes)}
+
+    indegree = [0] * len(nodes)         #stores how many files each file depends on
+    graph = [[] for _ in nodes]         #reversed dependency graph (i.e., B.sol → A.sol if A imports B)
 
     # Build the reversed graph
     """ 'A.sol': ['B.sol', 'C.sol]
             ==> graph['B.sol'] = ['A.sol'], indegree['A.sol'] += 1
     """
     for node, deps in imports_map.items():
+        node_i = index_of[node]
         for dep_path in deps:
-            # dep_path = os.path.normpath(dep)
-            graph[dep_path].append(node)
-            indegree[node] += 1
-            all_nodes.add(dep_path)
+            graph[index_of[dep_path]].append(node_i)
+            indegree[node_i] += 1
 
     # all starting points (files with no dependencies)
-    queue = deque([n for n in all_nodes if indegree[n] == 0])
+    queue = deque([i for i, deg in enumerate(indegree) if deg == 0])
     result = []
 
     # Topological Sort Logic (Kahn’s Algorithm)
     while queue:
-        node = queue.popleft()
-        result.append(node)
+        node_i = queue.popleft()
+        result.append(node_i)
 
         # Visit all files that depend on this node & update
-        for neighbor in graph[node]: 
+        for neighbor in graph[node_i]:
             indegree[neighbor] -= 1
             if indegree[neighbor] == 0:
                 queue.append(neighbor)
 
-    if len(result) != len(all_nodes):
+    if len(result) != len(nodes):
         raise ValueError( "\tCyclic import detected !")
 
-    return result  # ordered list of files to include (from leaf to root)
+    return [nodes[i] for i in result]  # ordered list of files to include (from leaf to root)
 
 
 def normalize_spdx_license(content: str, spdx_override: Optional[str] = None ) -> str:
@@ -244,18 +499,26 @@ def normalize_spdx_license(content: str, spdx_override: Optional[str] = None ) -
     - or The most common SPDX found in all the file
     - Nothing if no SPDX is found and none is provided
     """
-    # Find all SPDX lines using Regex
-    spdx_pattern = r'^\s*//\s*SPDX-License-Identifier:\s*([^\s]+)\s*$'
-    matches = re.findall(spdx_pattern, content, re.MULTILINE)
+    # Cheap substring probe before paying for the multiline regex walk
+    if 'SPDX-License-Identifier' not in content:
+        if spdx_override:
+            return f"// SPDX-License-Identifier: {spdx_override}\n\n" + content.strip()
+        return content.strip()
+
+    # Collect and strip SPDX lines in a single pass over the content
+    counter: Counter = Counter()
+
+    def _collect(m):
+        counter[m.group(1)] += 1
+        return ''
 
-    # Remove all SPDX lines
-    content_wo_spdx = re.sub(spdx_pattern, '', content, flags=re.MULTILINE).strip()
+    content_wo_spdx = SPDX_RE.sub(_collect, content).strip()
 
     # Decide what SPDX license to use
     if spdx_override:
         header = f"// SPDX-License-Identifier: {spdx_override}\n\n"
-    elif matches:
-        most_common = Counter(matches).most_common(1)[0][0]
+    elif counter:
+        most_common = counter.most_common(1)[0][0]
         header = f"// SPDX-License-Identifier: {most_common}\n\n"
     else:
         header = ""
@@ -0,0 +1,8 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_parse_cache(tmp_path, monkeypatch):
+    """Point the parse disk cache at a per-test dir so tests never read
+    from or write to the developer's real ~/.cache/solderx/parsecache."""
+    monkeypatch.setattr("solderx.utils.PARSE_CACHE_DIR", str(tmp_path / "parse-cache"))
@@ -171,6 +171,19 @@ def test_cyclic_import_detection(tmp_contract_dir):
         solder_file(str(tmp_contract_dir / "A.sol"), remappings={}, save_file=False)
 
 
+def test_cyclic_import_message_lists_cycle_path(tmp_contract_dir):
+    """The cyclic-import error names every file on the cycle"""
+    (tmp_contract_dir / "A.sol").write_text(CYCLIC_A)
+    (tmp_contract_dir / "B.sol").write_text(CYCLIC_B)
+
+    with pytest.raises(ValueError) as excinfo:
+        solder_file(str(tmp_contract_dir / "A.sol"), remappings={}, save_file=False)
+
+    message = str(excinfo.value)
+    assert "A.sol" in message
+    assert "B.sol" in message
+
+
 def test_remapping_import(tmp_path):
     oz_path = tmp_path / "lib" / "oz" / "contracts"
     oz_path.mkdir(parents=True)
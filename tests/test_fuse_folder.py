@@ -74,6 +74,17 @@ def test_duplicate_imports_are_deduplicated(tmp_path):
     output = solder_folder(str(tmp_path), save_file=False)
     assert output.count("contract B") == 1
 
+def test_duplicate_content_files_are_emitted_once(tmp_path):
+    shared = "contract Shared {}"
+    write_sol_file(tmp_path, "lib/Shared.sol", shared)
+    write_sol_file(tmp_path, "vendor/Shared.sol", shared)
+    write_sol_file(tmp_path, "A.sol", "import './lib/Shared.sol'; contract A {}")
+    write_sol_file(tmp_path, "B.sol", "import './vendor/Shared.sol'; contract B {}")
+    output = solder_folder(str(tmp_path), save_file=False)
+    assert output.count("contract Shared") == 1
+    assert "contract A" in output
+    assert "contract B" in output
+
 def test_empty_file(tmp_path):
     write_sol_file(tmp_path, "Empty.sol", "")
     write_sol_file(tmp_path, "Main.sol", "import './Empty.sol'; contract M {}")
@@ -3,6 +3,12 @@ import json
 from unittest.mock import patch, MagicMock
 from solderx import solder_scan
 
+@pytest.fixture(autouse=True)
+def isolated_explorer_cache(tmp_path, monkeypatch):
+    """Point the explorer disk cache at a per-test dir so tests stay isolated."""
+    monkeypatch.setattr("solderx.fuse_scan.EXPLORER_CACHE_DIR", str(tmp_path / "explorer-cache"))
+
+
 # Sample mock JSON source (multi-file project)
 MOCK_VERIFIED_SOURCE_JSON = {
     "status": "1",
@@ -41,7 +47,7 @@ MOCK_FLATTENED_SOURCE = {
 }
 
 
-@patch("solderx.fuse_scan.requests.get")
+@patch("solderx.fuse_scan._SESSION.get")
 def test_solder_scan_multi_file_json(mock_get):
     mock_get.return_value = MagicMock(status_code=200, json=lambda: MOCK_VERIFIED_SOURCE_JSON)
     flat_code = solder_scan("eth:0x1234567890123456789012345678901234567890", save_file=False)
@@ -50,7 +56,7 @@ def test_solder_scan_multi_file_json(mock_get):
     assert "SPDX-License-Identifier" in flat_code
 
 
-@patch("solderx.fuse_scan.requests.get")
+@patch("solderx.fuse_scan._SESSION.get")
 def test_solder_scan_flattened_source(mock_get):
     mock_get.return_value = MagicMock(status_code=200, json=lambda: MOCK_FLATTENED_SOURCE)
     flat_code = solder_scan("eth:0x9876543210987654321098765432109876543210", save_file=False)
@@ -58,19 +64,19 @@ def test_solder_scan_flattened_source(mock_get):
     assert "SPDX-License-Identifier" in flat_code
 
 
-@patch("solderx.fuse_scan.requests.get")
+@patch("solderx.fuse_scan._SESSION.get")
 def test_invalid_address(mock_get):
     with pytest.raises(ValueError, match="Invalid contract address"):
         solder_scan("eth:1234", save_file=False)
 
 
-@patch("solderx.fuse_scan.requests.get")
+@patch("solderx.fuse_scan._SESSION.get")
 def test_unsupported_chain(mock_get):
     with pytest.raises(ValueError, match="Unsupported chain"):
         solder_scan("doge:0x1234567890123456789012345678901234567890", save_file=False)
 
 
-@patch("solderx.fuse_scan.requests.get")
+@patch("solderx.fuse_scan._SESSION.get")
 def test_import_not_found_raises(mock_get):
     broken_source = {
         "status": "1",
@@ -92,7 +98,7 @@ def test_import_not_found_raises(mock_get):
         solder_scan("eth:0xdeadbeefdeadbeefdeadbeefdeadbeefdeadbeef", save_file=False)
 
 
-@patch("solderx.fuse_scan.requests.get")
+@patch("solderx.fuse_scan._SESSION.get")
 def test_save_file_output(mock_get, tmp_path):
     mock_get.return_value = MagicMock(status_code=200, json=lambda: MOCK_VERIFIED_SOURCE_JSON)
     output_path = tmp_path / "out.sol"
@@ -101,7 +107,7 @@ def test_save_file_output(mock_get, tmp_path):
     assert "contract Main" in output_path.read_text()
 
 
-@patch("solderx.fuse_scan.requests.get")
+@patch("solderx.fuse_scan._SESSION.get")
 def test_suffix_match_import_resolution(mock_get):
     source_with_suffix = {
         "status": "1",
@@ -123,7 +129,7 @@ def test_suffix_match_import_resolution(mock_get):
     assert "contract Context" in flat_code
     assert "contract Main" in flat_code
 
-@patch("solderx.fuse_scan.requests.get")
+@patch("solderx.fuse_scan._SESSION.get")
 def test_relative_import_up_one_level(mock_get):
     mock_response = {
         "status": "1",
@@ -145,7 +151,7 @@ def test_relative_import_up_one_level(mock_get):
     assert "contract Context" in flat_code
     assert "contract Main" in flat_code
 
-@patch("solderx.fuse_scan.requests.get")
+@patch("solderx.fuse_scan._SESSION.get")
 def test_relative_import_multiple_levels(mock_get):
     mock_response = {
         "status": "1",
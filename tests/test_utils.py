@@ -0,0 +1,24 @@
+import json
+import pytest
+from solderx.utils import parse_remappings
+
+
+def test_inline_remappings_basic():
+    assert parse_remappings("@a=lib/a,@b=x") == {"@a": "lib/a", "@b": "x"}
+
+def test_inline_remappings_strip_whitespace():
+    assert parse_remappings(" @a = lib/a , @b = x ") == {"@a": "lib/a", "@b": "x"}
+
+@pytest.mark.parametrize("bad", ["noequals", "a=b=c", "a=,b=c", "@a=lib/a,", ","])
+def test_inline_remappings_reject_malformed(bad):
+    with pytest.raises(ValueError, match="Invalid remapping format"):
+        parse_remappings(bad)
+
+def test_inline_remappings_duplicate_alias_raises():
+    with pytest.raises(ValueError, match="Duplicate remapping alias"):
+        parse_remappings("@a=x,@a=y")
+
+def test_remapping_file_keys_and_values_are_stripped(tmp_path):
+    remap_file = tmp_path / "remap.json"
+    remap_file.write_text(json.dumps({"@oz ": " lib/oz "}))
+    assert parse_remappings(str(remap_file)) == {"@oz": "lib/oz"}